@@ -8,6 +8,7 @@ from app.config import settings
 from app.utils.logger import logger
 from app.utils.metrics import record_metrics
 from app.utils.model import JSONDataRequest
+from app.utils.serializer import MongoJSONResponse
 from app.scrap import get_medicine_detail_scrap, scap_medicine
 from app.db import mongo, insert_document, fetch_user
 
@@ -28,7 +29,8 @@ app = FastAPI(
         "name": "Ashish Bindra",
         "url": "https://github.com/ashishbindra2",
         "email": "ashishbindra2@gmail.com",
-    }
+    },
+    default_response_class=MongoJSONResponse,
 )
 scheduler = AsyncIOScheduler()
 
@@ -69,7 +71,7 @@ async def api_extract_medicine(request: Request, url: str):
     try:
         async for data in get_medicine_detail_scrap(url):
             logger.info("Extraction successful", medicine_details=data)
-            return data
+            return MongoJSONResponse(data)
     except Exception as e:
         logger.error("Extraction failed", error=str(e))
         raise HTTPException(status_code=400, detail=str(e))
@@ -104,11 +106,11 @@ async def api_upload_image(file: UploadFile, user_uuid: str = Form(...), filenam
         logger.error(f"File upload failed: {e}")
         raise HTTPException(status_code=500, detail=f"File upload failed: {e}")
 
-    return {
+    return MongoJSONResponse({
         "status": "success",
         "message": "Image uploaded successfully",
         "file_path": image_path
-    }
+    })
 
 
 @app.post('/store-data')
@@ -132,28 +134,28 @@ async def api_store_data_db(request: JSONDataRequest):
     data = request.data
     if not collection_name:
         logger.error("Invalid collection name provided. The collection name is empty or missing.")
-        return {
+        return MongoJSONResponse({
             "message": "Please enter collection name",
             "collection_name": '',
-            "data": data
-        }
+            "data": data.model_dump() if data else None
+        })
     if not data:
         logger.error("Invalid data provided. The data is empty or missing.")
 
-        return {
+        return MongoJSONResponse({
             "message": "Data is empty!",
             "collection_name": collection_name,
             "data": None
-        }
+        })
 
     try:
-        inserted_id = await insert_document(collection_name, data.dict())
+        inserted_id = await insert_document(collection_name, data.model_dump())
         logger.info(f"Data inserted successfully into the collection {collection_name}. Inserted ID: {inserted_id}")
-        return {
+        return MongoJSONResponse({
             "status": "success",
             "message": "Data stored successfully",
-            "inserted_id": str(inserted_id)
-        }
+            "inserted_id": inserted_id
+        })
     except Exception as e:
         logger.critical(f"Critical error occurred during data insertion in the collection {collection_name}. Error:"
                         f" {str(e)}", exc_info=True)
@@ -179,10 +181,10 @@ async def api_retrieve_image(uuid: str, filename: str):
 
     if not os.path.exists(img_path):
         logger.warning(f"Image not found. UUID: {uuid}, Filename: {filename}. Checked path: {img_path}")
-        return {
+        return MongoJSONResponse({
             "status": "error",
             "message": "File not found"
-        }
+        })
     logger.info(f"Image found. Serving file from path: {img_path}")
 
     try:
@@ -214,16 +216,16 @@ async def api_get_data(user_id: str):
         if not user_data:
             logger.warning(f"No user data found for user_id: {user_id}")
 
-            return {
+            return MongoJSONResponse({
                 "status": "error",
                 "message": "User data not found"
-            }
+            })
         logger.info(f"Successfully retrieved user data for user_id: {user_id}")
 
-        return {
+        return MongoJSONResponse({
             "status": "success",
             "data": user_data
-        }
+        })
     except Exception as e:
         logger.critical(f"An error occurred while retrieving user data for user_id: {user_id}. Error: {str(e)}",
                         exc_info=True)
@@ -244,7 +246,7 @@ async def api_run_scheduled_scraping():
     logger.info("Scheduled scraping task started.")
 
     response = await scap_medicine()
-    return response
+    return MongoJSONResponse(response)
 
 
 @app.get("/metrics")
@@ -273,7 +275,7 @@ async def api_medicine_detail(number: int):
         logger.error("Error occurred while fetching medicine details: %s", e)
         raise
 
-    return {"data": data}
+    return MongoJSONResponse({"data": data})
 
 
 @app.get("/users", tags=["developer"])
@@ -283,7 +285,7 @@ async def users():
     :return:
     """
     cursor = await mongo.fetch_users()
-    return {"users list": cursor}
+    return MongoJSONResponse({"users list": cursor})
 
 
 @app.on_event("startup")
@@ -0,0 +1,31 @@
+import orjson
+from bson import Decimal128, ObjectId, json_util
+from fastapi.responses import ORJSONResponse
+
+
+def bson_default(value):
+    """
+    Fallback encoder for BSON types that orjson cannot serialize natively.
+    Args:
+        value: The object orjson failed to encode.
+    Returns:
+        str | dict: The string form of ObjectId/Decimal128 values, otherwise the
+        relaxed Extended JSON form (e.g. bytes become {"$binary": ...}).
+    Raises:
+        TypeError: If the value is not a BSON type.
+    """
+    if isinstance(value, (ObjectId, Decimal128)):
+        return str(value)
+    return json_util.default(value, json_options=json_util.RELAXED_JSON_OPTIONS)
+
+
+class MongoJSONResponse(ORJSONResponse):
+    """
+    orjson response that renders Mongo documents straight to bytes.
+
+    Returning this class from an endpoint skips FastAPI's jsonable_encoder pass,
+    so documents are serialized once without intermediate dict copies.
+    """
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, default=bson_default)
@@ -0,0 +1,76 @@
+"""
+Micro-benchmark of per-request serialization cost.
+
+Compares the previous path (``.dict()`` + jsonable_encoder + stdlib JSONResponse)
+with the current one (``model_dump()`` + MongoJSONResponse) for the payloads
+built by ``/store-data`` and ``/get-data/``.
+
+Run from the project root:
+    python -m benchmarks.bench_serialization
+"""
+import timeit
+import warnings
+
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.utils.model import JSONDataRequest
+from app.utils.serializer import MongoJSONResponse
+
+NUMBER = 20_000
+
+REQUEST_BODY = {
+    "collection_name": "users",
+    "data": {"user_id": "12345", "name": "John Doe", "email": "john@example.com"},
+}
+USER_DOCUMENT = {"user_id": "12345", "name": "John Doe", "email": "john@example.com"}
+INSERTED_ID = ObjectId()
+
+# Silence the .dict() deprecation once so both paths are timed without warning overhead.
+warnings.filterwarnings("ignore", category=DeprecationWarning)
+
+
+def store_data_before():
+    request = JSONDataRequest(**REQUEST_BODY)
+    request.data.dict()
+    return JSONResponse(jsonable_encoder({
+        "status": "success",
+        "message": "Data stored successfully",
+        "inserted_id": str(INSERTED_ID)
+    })).body
+
+
+def store_data_after():
+    request = JSONDataRequest(**REQUEST_BODY)
+    request.data.model_dump()
+    return MongoJSONResponse({
+        "status": "success",
+        "message": "Data stored successfully",
+        "inserted_id": INSERTED_ID
+    }).body
+
+
+def get_data_before():
+    return JSONResponse(jsonable_encoder({"status": "success", "data": USER_DOCUMENT})).body
+
+
+def get_data_after():
+    return MongoJSONResponse({"status": "success", "data": USER_DOCUMENT}).body
+
+
+def bench(name, func):
+    seconds = min(timeit.repeat(func, number=NUMBER, repeat=5))
+    per_call = seconds / NUMBER * 1e6
+    print(f"{name:<20} {per_call:8.2f} us/request")
+    return per_call
+
+
+if __name__ == "__main__":
+    for label, before, after in (
+            ("/store-data", store_data_before, store_data_after),
+            ("/get-data/", get_data_before, get_data_after),
+    ):
+        old = bench(f"{label} before", before)
+        new = bench(f"{label} after", after)
+        print(f"{label:<20} {old / new:8.2f}x faster\n")
@@ -0,0 +1,107 @@
+from datetime import datetime
+
+import orjson
+import pytest
+from bson import Decimal128, ObjectId
+from fastapi.testclient import TestClient
+
+from app import main
+from app.utils.serializer import MongoJSONResponse, bson_default
+
+client = TestClient(main.app)
+
+OBJECT_ID = ObjectId("65a1f0c2e4b0a1b2c3d4e5f6")
+USER_DOCUMENT = {
+    "user_id": "12345",
+    "ref": OBJECT_ID,
+    "balance": Decimal128("12.50"),
+    "created_at": datetime(2024, 1, 2, 3, 4, 5),
+}
+USER_JSON = {
+    "user_id": "12345",
+    "ref": "65a1f0c2e4b0a1b2c3d4e5f6",
+    "balance": "12.50",
+    "created_at": "2024-01-02T03:04:05",
+}
+
+
+def test_mongo_response_renders_object_id():
+    response = MongoJSONResponse({"status": "success", "inserted_id": OBJECT_ID})
+    assert orjson.loads(response.body) == {"status": "success", "inserted_id": str(OBJECT_ID)}
+
+
+def test_mongo_response_renders_decimal128():
+    response = MongoJSONResponse({"price": Decimal128("12.50")})
+    assert orjson.loads(response.body) == {"price": "12.50"}
+
+
+def test_mongo_response_renders_bytes_as_extended_json():
+    response = MongoJSONResponse({"blob": b"ab"})
+    assert orjson.loads(response.body) == {"blob": {"$binary": {"base64": "YWI=", "subType": "00"}}}
+
+
+def test_bson_default_rejects_unsupported_type():
+    with pytest.raises(TypeError):
+        bson_default(object())
+    with pytest.raises(orjson.JSONEncodeError):
+        MongoJSONResponse({"data": object()})
+
+
+def test_store_data_returns_inserted_object_id(monkeypatch):
+    async def insert_stub(collection_name, document):
+        return OBJECT_ID
+
+    monkeypatch.setattr(main, "insert_document", insert_stub)
+    response = client.post(
+        "/store-data",
+        json={
+            "collection_name": "users",
+            "data": {"user_id": "12345", "name": "John Doe", "email": "john@example.com"},
+        },
+    )
+    assert response.status_code == 200
+    assert response.json() == {
+        "status": "success",
+        "message": "Data stored successfully",
+        "inserted_id": "65a1f0c2e4b0a1b2c3d4e5f6",
+    }
+
+
+def test_get_data_renders_bson_document(monkeypatch):
+    async def fetch_stub(query):
+        return USER_DOCUMENT
+
+    monkeypatch.setattr(main, "fetch_user", fetch_stub)
+    response = client.get("/get-data/", params={"user_id": "12345"})
+    assert response.status_code == 200
+    assert response.json() == {"status": "success", "data": USER_JSON}
+
+
+def test_get_data_not_found_returns_json(monkeypatch):
+    async def fetch_stub(query):
+        return None
+
+    monkeypatch.setattr(main, "fetch_user", fetch_stub)
+    response = client.get("/get-data/", params={"user_id": "missing"})
+    assert response.status_code == 200
+    assert response.json() == {"status": "error", "message": "User data not found"}
+
+
+def test_users_renders_bson_documents(monkeypatch):
+    async def fetch_users_stub():
+        return [USER_DOCUMENT]
+
+    monkeypatch.setattr(main.mongo, "fetch_users", fetch_users_stub)
+    response = client.get("/users")
+    assert response.status_code == 200
+    assert response.json() == {"users list": [USER_JSON]}
+
+
+def test_medicine_renders_bson_documents(monkeypatch):
+    async def medicine_stub(limit):
+        yield USER_DOCUMENT
+
+    monkeypatch.setattr(main.mongo, "get_medicine_details", medicine_stub)
+    response = client.get("/medicine", params={"number": 1})
+    assert response.status_code == 200
+    assert response.json() == {"data": [USER_JSON]}